@@ -4,7 +4,11 @@ import polars as pl
 def load_excel_with_fallback(filepath: str, sheet_name: str) -> pl.DataFrame:
     """Load an Excel sheet with schema inference disabled to handle data type issues."""
 
-    # Load with schema inference disabled to force all columns as strings
-    df = pl.read_excel(filepath, sheet_name=sheet_name, infer_schema_length=0)
+    # Load with schema inference disabled to force all columns as strings.
+    # The engine is pinned to calamine (the Polars default) so the reader
+    # does not change underneath us if that default ever moves.
+    df = pl.read_excel(
+        filepath, sheet_name=sheet_name, engine="calamine", infer_schema_length=0
+    )
     print("Sheet loaded with schema inference disabled (all columns as strings)")
     return df
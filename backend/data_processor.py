@@ -1,19 +1,41 @@
 import polars as pl
-from typing import List
+from typing import List, Union
+
+
+def required_columns(
+    grouping_cols: List[str], start_date_col: str, driver_col: str
+) -> List[str]:
+    """
+    Returns the columns aggregate_data reads, in order and without duplicates.
+
+    Callers that build their own reader or LazyFrame can project to this list
+    up front so unused columns are never parsed.
+    """
+    return list(dict.fromkeys(grouping_cols + [start_date_col, driver_col]))
 
 
 def aggregate_data(
-    df: pl.DataFrame, grouping_cols: List[str], start_date_col: str, driver_col: str
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    grouping_cols: List[str],
+    start_date_col: str,
+    driver_col: str,
+    driver_dtype: pl.DataType = pl.Float64,
 ) -> pl.DataFrame:
     """
     Performs time-series aggregation on the input DataFrame, pivoting by month,
     and adding a 'Total' column and a 'GRAND TOTAL' row.
 
     Args:
-        df: The DataFrame containing the data to aggregate.
+        df: The DataFrame containing the data to aggregate. A LazyFrame (e.g. from
+            pl.scan_csv or pl.scan_parquet) is also accepted, in which case only
+            the required columns are read and the source is scanned once. The
+            invalid-date filter applies to the parsed column, so it runs after
+            the scan rather than inside the reader.
         grouping_cols: A list of column names to group by (e.g., location, activity).
         start_date_col: The name of the column containing the start date (e.g., 'start_date').
         driver_col: The name of the column containing the numeric driver values to sum (e.g., 'value').
+        driver_dtype: The float type the driver is cast to. Pass pl.Float32 when the
+            values fit, to halve the bytes moved through the aggregation.
 
     Returns:
         A Polars DataFrame pivoted by month with a 'Total' column and a 'GRAND TOTAL' row.
@@ -24,104 +46,120 @@ def aggregate_data(
         Exception: For other unexpected errors during processing.
     """
     # Input Validation
-    required_cols = set(grouping_cols + [start_date_col, driver_col])
-    available_cols = set(df.columns)
+    # The schema is read once and reused for both validation and dtype checks
+    schema = df.collect_schema()
+    needed_cols = required_columns(grouping_cols, start_date_col, driver_col)
+    missing = [col for col in needed_cols if col not in schema]
 
-    if not required_cols.issubset(available_cols):
-        missing = required_cols - available_cols
+    if missing:
         raise ValueError(
             f"Missing required columns in DataFrame: {', '.join(missing)}. "
-            f"Available columns: {', '.join(available_cols)}"
+            f"Available columns: {', '.join(schema)}"
         )
 
     print(f"Starting aggregation. Grouping by: {grouping_cols}")
 
     try:
-        # Select relevant columns and transform them using lazy evaluation
-        # Convert date string to datetime, cast driver to float, handle nulls,
-        # and truncate dates to the first day of the month for pivoting.
-        df_transformed = (
-            df.lazy()  # Start lazy evaluation for performance
-            .select(grouping_cols + [start_date_col, driver_col])
-            .with_columns(
+        # Typed readers return real date cells; only parse when given strings
+        if schema[start_date_col] in (pl.Date, pl.Datetime):
+            parsed_date = pl.col(start_date_col).alias("parsed_date")
+        else:
+            parsed_date = (
                 pl.col(start_date_col)
                 .str.to_datetime(strict=False)
-                .alias("parsed_date"),
+                .alias("parsed_date")
+            )
+
+        # Select relevant columns and transform them using lazy evaluation
+        # Parse the start date, cast the driver to float, drop rows with invalid
+        # dates and derive the Int32 yyyymm month_key used for aggregation.
+        monthly_lf = (
+            df.lazy()  # Start lazy evaluation (a no-op for LazyFrame input)
+            .select(needed_cols)
+            .with_columns(
+                parsed_date,
+                # Unparsable drivers become null, which sum() skips
                 pl.col(driver_col)
-                .cast(pl.Float64, strict=False)
-                .fill_null(0)
+                .cast(driver_dtype, strict=False)
                 .alias("numeric_driver"),
             )
-            .filter(
-                pl.col("parsed_date").is_not_null()
-            )  # Remove rows with invalid dates
+            .drop_nulls(subset=["parsed_date"])  # Remove rows with invalid dates
             .with_columns(
-                pl.col("parsed_date").dt.truncate("1mo").alias("month_period")
+                # Encode the month as a fixed-width yyyymm integer so grouping
+                # and filtering compare 4-byte keys rather than dates or strings
+                (
+                    pl.col("parsed_date").dt.year().cast(pl.Int32) * 100
+                    + pl.col("parsed_date").dt.month().cast(pl.Int32)
+                ).alias("month_key")
             )
-            .collect()  # Collect the results after all transformations
+        )
+
+        # Sum the driver per group and month inside the lazy plan, so the input
+        # is read and every date parsed exactly once. Only this narrow long
+        # frame (one row per group and month) is materialized.
+        monthly_df = (
+            monthly_lf.group_by(grouping_cols + ["month_key"])
+            .agg(pl.col("numeric_driver").sum())
+            .collect(engine="streaming")
         )
 
         # Early exit if no valid data remains
-        if df_transformed.height == 0:
+        if monthly_df.height == 0:
             print(
                 "Warning: No valid data found after date parsing and filtering. Returning empty DataFrame."
             )
-            # Create an empty DataFrame with expected columns for consistency
-            empty_cols = grouping_cols + ["Total"]
-            return pl.DataFrame({col: [] for col in empty_cols})
-
-        # 2. Perform the pivot operation to aggregate driver values by month
-        # This creates new columns for each unique month_period.
-        pivoted_df = df_transformed.pivot(
-            values="numeric_driver",
-            index=grouping_cols,
-            on="month_period",
-            aggregate_function="sum",
-        ).sort(grouping_cols)  # Sort by grouping columns for consistent output
-
-        # 3. Sort the month columns chronologically and select final columns
-        # Identify columns that represent months (not grouping columns)
-        month_cols = sorted(
-            [col for col in pivoted_df.columns if col not in grouping_cols]
-        )
+            # Create an empty DataFrame with the same columns and dtypes as a
+            # populated result, so no schema has to be inferred from empty lists
+            return pl.DataFrame(
+                schema={col: pl.Utf8 for col in grouping_cols} | {"Total": driver_dtype}
+            )
 
-        if not month_cols:
-            print(
-                "Warning: No month columns generated after pivot. This might indicate no data or an issue with month_period creation."
+        # 2. Pivot the per-month sums wide, one column per known month
+        # The months come from the already-aggregated frame, and only the
+        # distinct months are formatted as "YYYY-MM" column names
+        months = monthly_df.get_column("month_key").unique().sort().to_list()
+        month_cols = [f"{key // 100:04d}-{key % 100:02d}" for key in months]
+        pivoted_df = (
+            monthly_df.pivot(
+                on="month_key", index=grouping_cols, values="numeric_driver"
             )
-            # Return the pivoted_df as is, potentially with just grouping_cols
-            return pivoted_df.select(grouping_cols)
-
-        # Ensure all month columns are present, filling with 0 if a group had no data for a month
-        # This is important if `pivot` doesn't create all possible month columns for all groups
-        final_df = pivoted_df.select(grouping_cols + month_cols).fill_null(0)
-
-        # 4. Add a horizontal total for each row (sum across month columns)
-        final_df = final_df.with_columns(Total=pl.sum_horizontal(month_cols))
-
-        # 5. Create and append the "GRAND TOTAL" summary row
-        # Calculate sums for all numeric columns (month columns + 'Total')
-        numeric_totals = final_df.select(month_cols + ["Total"]).sum()
-
-        # Construct the grand total row data
-        grand_total_data = {}
-        # The first grouping column gets the "GRAND TOTAL" label
-        grand_total_data[grouping_cols[0]] = "GRAND TOTAL"
-        # Subsequent grouping columns are left blank or with a placeholder
-        for col in grouping_cols[1:]:
-            grand_total_data[col] = ""
-
-        # Add the calculated numeric totals
-        for col in month_cols + ["Total"]:
-            grand_total_data[col] = numeric_totals[col][
-                0
-            ]  # .sum() returns a DataFrame, take the first element
-
-        # Create a DataFrame for the total row and concatenate
-        total_row = pl.DataFrame([grand_total_data])
-        final_df = pl.concat([final_df, total_row], how="vertical")
-
-        return final_df
+            .rename({str(key): col for key, col in zip(months, month_cols)})
+            .sort(grouping_cols)  # Sort by grouping columns for consistent output
+        )
+
+        # Months in which a group had no data become 0, and the row 'Total'
+        # is the sum across the month columns. The Total cannot be another
+        # aggregation in the group_by above: that groups by month as well, so
+        # a per-group total only exists once the months are pivoted wide.
+        pivoted_lf = (
+            pivoted_df.lazy()
+            .with_columns(pl.col(month_cols).fill_null(0))
+            .with_columns(Total=pl.sum_horizontal(month_cols))
+        )
+
+        # Steps 3 and 4 run over the small pivoted frame (one row per group),
+        # and the fill, Total, cast and GRAND TOTAL row are evaluated together
+        # by the collect at the end. The input itself was read only once, above.
+        # 3. Cast grouping columns to Utf8 (O(grouping_cols)) so the
+        # "GRAND TOTAL" label row concatenates without touching the numeric
+        # month columns.
+        final_lf = pivoted_lf.select(
+            pl.col(grouping_cols).cast(pl.Utf8),
+            pl.col(month_cols + ["Total"]),
+        )
+
+        # 4. Create and append the "GRAND TOTAL" summary row
+        # Sum all numeric columns (month columns + 'Total') in a single select;
+        # the first grouping column carries the label, the rest are left blank
+        total_lf = final_lf.select(
+            [pl.lit("GRAND TOTAL").alias(grouping_cols[0])]
+            + [pl.lit("").alias(col) for col in grouping_cols[1:]]
+            + [pl.col(col).sum() for col in month_cols + ["Total"]]
+        )
+
+        return pl.concat([final_lf, total_lf], how="vertical_relaxed").collect(
+            engine="streaming"
+        )
 
     except Exception as e:
         print(f"An error occurred during data aggregation: {e}")
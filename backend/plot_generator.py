@@ -1,7 +1,28 @@
 import matplotlib.pyplot as plt
-import pandas as pd
+import numpy as np
 import polars as pl
-from typing import List, Dict, Any
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+
+
+@lru_cache(maxsize=4096)
+def _format_month_label(month_col: str) -> str:
+    """
+    Formats a YYYY-MM column name as 'Mon YYYY', falling back to the raw name.
+
+    Cached, since every entry of a frame shares the same month columns.
+    """
+    try:
+        return datetime.strptime(month_col, "%Y-%m").strftime("%b %Y")
+    except ValueError:
+        return month_col
+
+
+def get_month_columns(df: pl.DataFrame, grouping_cols: List[str]) -> List[str]:
+    """Return the month columns: everything except the grouping columns and 'Total'."""
+    excluded = set(grouping_cols) | {"Total"}
+    return [col for col in df.columns if col not in excluded]
 
 
 def generate_plot(
@@ -10,32 +31,39 @@ def generate_plot(
     selected_entry_label: str,
     grouping_cols: List[str],
     plot_settings: Dict[str, Any],
+    month_cols: Optional[List[str]] = None,
+    figure: Optional[plt.Figure] = None,
 ) -> plt.Figure:
     """
     Generates a plot for a selected entry's monthly driver profile with customizable settings.
+
+    Callers plotting many entries from the same frame can pass month_cols once
+    (see get_month_columns) instead of having it re-derived on every call.
+    Passing an existing figure clears and redraws into it rather than building
+    a new one.
     """
-    figure = plt.Figure(figsize=(10, 6), dpi=100)
+    if figure is None:
+        figure = plt.Figure(figsize=(10, 6), dpi=100)
+    else:
+        figure.clear()
     ax = figure.add_subplot(111)
 
-    # Get monthly columns (exclude grouping columns and 'Total')
-    month_cols = [
-        col for col in df.columns if col not in grouping_cols and col != "Total"
-    ]
-
-    values, valid_months = [], []
-    for month_col in month_cols:
-        value = df[month_col][entry_index]
-        if value is not None:
-            values.append(float(value))
-            # Format month name for display on the x-axis
-            try:
-                month_name = pd.to_datetime(month_col).strftime("%b %Y")
-                valid_months.append(month_name)
-            except (ValueError, TypeError):
-                valid_months.append(month_col)
+    if month_cols is None:
+        month_cols = get_month_columns(df, grouping_cols)
+
+    # Fetch the entry's month cells once as a plain tuple, keeping only the
+    # months that have a value
+    row = df.select(month_cols).row(entry_index)
+    present_months = [col for col, value in zip(month_cols, row) if value is not None]
+    values = [value for value in row if value is not None]
+
+    # Format month names for display on the x-axis
+    valid_months = [_format_month_label(col) for col in present_months]
 
     if values:
-        x_positions = range(len(valid_months))
+        # Hand matplotlib arrays directly rather than lists it has to convert
+        values = np.asarray(values, dtype=np.float64)
+        x_positions = np.arange(values.size)
 
         # Apply plot settings
         plot_type = plot_settings.get("plot_type", "line")
@@ -56,7 +84,7 @@ def generate_plot(
                 color=color,
             )
         elif plot_type == "bar":
-            ax.bar(x_positions, values, color=color, alpha=0.7)
+            bars = ax.bar(x_positions, values, color=color, alpha=0.7)
         elif plot_type == "scatter":
             ax.scatter(
                 x_positions,
@@ -68,12 +96,20 @@ def generate_plot(
         elif plot_type == "step":
             ax.step(x_positions, values, color=color, linewidth=linewidth, where="mid")
 
-        # Add value labels above the points
-        for x, y in zip(x_positions, values):
-            if y != 0:  # Only label non-zero values for clarity
+        # Add value labels above the points, only for non-zero values for clarity
+        if plot_type == "bar":
+            # Label all bars in a single call
+            ax.bar_label(
+                bars,
+                labels=[f"{y:,.0f}" if y != 0 else "" for y in values],
+                padding=3,
+                fontsize=9,
+            )
+        else:
+            for i in np.flatnonzero(values != 0):
                 ax.annotate(
-                    f"{y:,.0f}",
-                    (x, y),
+                    f"{values[i]:,.0f}",
+                    (x_positions[i], values[i]),
                     textcoords="offset points",
                     xytext=(0, 10),
                     ha="center",
@@ -93,7 +129,7 @@ def generate_plot(
         ax.set_title(truncated_title)
 
         # Display total sum in a text box
-        total_sum = sum(values)
+        total_sum = values.sum()
         ax.text(
             0.02,
             0.98,
@@ -115,5 +151,7 @@ def generate_plot(
         )
         ax.set_title(f"No Data for: {selected_entry_label}")
 
-    figure.tight_layout()
+    # Fixed margins sized for the rotated month labels, instead of running the
+    # tight_layout solver on every redraw
+    figure.subplots_adjust(bottom=0.22, left=0.1, right=0.97, top=0.92)
     return figure
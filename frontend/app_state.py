@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import polars as pl
 
 
@@ -16,6 +16,14 @@ class AppState:
         self.final_dataframe: Optional[pl.DataFrame] = None
         self.driver_col: Optional[str] = None
 
+        # Inputs that produced final_dataframe, so an identical re-run from
+        # Stage 3 can reuse the result instead of aggregating again
+        self.aggregation_key: Optional[Tuple] = None
+
+        # Identifies the sheet held in df as (excel_file, mtime, sheet_name), so
+        # reloading the same unchanged sheet from Stage 1 reuses it
+        self.sheet_key: Optional[Tuple] = None
+
         self.selected_columns: Dict[str, List[str]] = {
             "location": [],
             "activity": [],
@@ -23,8 +31,6 @@ class AppState:
             "drivers": [],
         }
 
-        self.inspection_log: str = ""
-
     def export_aggregated_data(self) -> Path:
         """Export final aggregated dataframe to CSV"""
         for file in self.output_directory.iterdir():
@@ -33,5 +39,6 @@ class AppState:
 
         safe_name = self.sheet_name.replace(" ", "_")
         export_path = self.output_directory / f"{safe_name}_aggregated.csv"
-        self.final_dataframe.write_csv(export_path)
+        # Stream through the lazy sink so the CSV is written in batches
+        self.final_dataframe.lazy().sink_csv(export_path)
         return export_path
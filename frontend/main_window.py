@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
-from datetime import datetime
+import time
 from typing import Optional
 import polars as pl
 
@@ -14,9 +14,22 @@ from .app_state import AppState
 class DataFrameInspector:
     """Lightweight inspection utilities for DataFrame operations"""
 
-    @staticmethod
-    def log_step(df: pl.DataFrame, step: str, details: str = "") -> str:
-        timestamp = datetime.now().strftime("%H:%M:%S")
+    # Formatted timestamp cached per wall-clock second
+    _last_ts_sec: int = -1
+    _last_ts_str: str = ""
+
+    @classmethod
+    def timestamp(cls) -> str:
+        """Return the current HH:MM:SS, formatted at most once per second"""
+        sec = int(time.time())
+        if sec != cls._last_ts_sec:
+            cls._last_ts_sec = sec
+            cls._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        return cls._last_ts_str
+
+    @classmethod
+    def log_step(cls, df: pl.DataFrame, step: str, details: str = "") -> str:
+        timestamp = cls.timestamp()
         return (
             f"[{timestamp}] {step}: {df.shape[0]} rows, {df.shape[1]} cols {details}\n"
         )
@@ -32,10 +45,15 @@ class DataFrameInspector:
             "COLUMNS:",
         ]
 
-        for i, col in enumerate(df.columns, 1):
-            lines.append(
-                f"  {i:2d}. {col:<30} ({str(df[col].dtype):<10}) - {df[col].null_count()} nulls"
+        # Fetch all dtypes and null counts in one call each rather than per column,
+        # then walk them side by side without per-column lookups
+        nulls = df.null_count().row(0)
+        lines.extend(
+            f"  {i:2d}. {col:<30} ({str(dtype):<10}) - {null_count} nulls"
+            for i, ((col, dtype), null_count) in enumerate(
+                zip(df.schema.items(), nulls), 1
             )
+        )
 
         lines.extend(
             [
@@ -129,9 +147,8 @@ class ApplicationUI:
         self.root.title(f"Excel Data Pipeline Processor - {title}")
 
     def _log_and_display(self, message: str):
-        """Add to log and update display"""
-        self.state.inspection_log += message
-        self.inspection_panel.update_log(self.state.inspection_log)
+        """Append a message to the inspection log display"""
+        self.inspection_panel.append_log(message)
 
     def _show_sheet_input(self):
         """Stage 1: Sheet name input"""
@@ -179,10 +196,21 @@ class ApplicationUI:
             return
 
         try:
-            print(f"Loading sheet: '{sheet_name}'...")
-            self.state.df = data_loader.load_excel_with_fallback(
-                self.state.excel_file, sheet_name
+            # The workbook's modification time is part of the key, so a file
+            # saved since the last load is always read again
+            sheet_key = (
+                self.state.excel_file,
+                os.path.getmtime(self.state.excel_file),
+                sheet_name,
             )
+            if self.state.df is not None and self.state.sheet_key == sheet_key:
+                print(f"Reusing loaded sheet: '{sheet_name}'")
+            else:
+                print(f"Loading sheet: '{sheet_name}'...")
+                self.state.df = data_loader.load_excel_with_fallback(
+                    self.state.excel_file, sheet_name
+                )
+                self.state.sheet_key = sheet_key
             self.state.sheet_name = sheet_name
 
             self._log_and_display(
@@ -253,7 +281,10 @@ class ApplicationUI:
     def _preview_selection(self):
         """Generate and display selection preview"""
         selected = self.column_tabs.get_selected_columns()
-        all_cols = [col for cols in selected.values() for col in cols]
+        # A column ticked in more than one category is previewed once, in order
+        all_cols = list(
+            dict.fromkeys(col for cols in selected.values() for col in cols)
+        )
 
         if not all_cols:
             messagebox.showwarning("No Selection", "Please select at least one column.")
@@ -286,9 +317,7 @@ class ApplicationUI:
             self.column_tabs.clear_all()
         self.state.selected_columns = {key: [] for key in self.state.selected_columns}
         self._update_selection_count()
-        self._log_and_display(
-            f"[{datetime.now().strftime('%H:%M:%S')}] SELECTIONS_CLEARED\n"
-        )
+        self._log_and_display(f"[{self.inspector.timestamp()}] SELECTIONS_CLEARED\n")
 
     def _validate_and_proceed_to_aggregation(self):
         """Validate selections and proceed to aggregation setup"""
@@ -403,21 +432,44 @@ class ApplicationUI:
             + self.state.selected_columns["activity"]
         )
 
-        try:
-            self.state.final_dataframe = data_processor.aggregate_data(
-                df=self.state.df,
-                grouping_cols=grouping_cols,
-                start_date_col=start_date_col,
-                driver_col=driver_col,
-            )
+        # sheet_key carries the workbook's mtime, so saving the file and
+        # reloading the sheet invalidates a previously aggregated result
+        aggregation_key = (
+            self.state.sheet_key,
+            tuple(grouping_cols),
+            start_date_col,
+            driver_col,
+        )
 
-            self._log_and_display(
-                self.inspector.log_step(
-                    self.state.final_dataframe,
-                    "AGGREGATION_COMPLETE",
-                    "Pivoted DataFrame created",
+        try:
+            if (
+                self.state.final_dataframe is not None
+                and self.state.aggregation_key == aggregation_key
+            ):
+                print("Reusing aggregation for unchanged inputs")
+                self._log_and_display(
+                    self.inspector.log_step(
+                        self.state.final_dataframe,
+                        "AGGREGATION_REUSED",
+                        "Inputs unchanged, previous result reused",
+                    )
+                )
+            else:
+                self.state.aggregation_key = None
+                self.state.final_dataframe = data_processor.aggregate_data(
+                    df=self.state.df,
+                    grouping_cols=grouping_cols,
+                    start_date_col=start_date_col,
+                    driver_col=driver_col,
+                )
+                self.state.aggregation_key = aggregation_key
+                self._log_and_display(
+                    self.inspector.log_step(
+                        self.state.final_dataframe,
+                        "AGGREGATION_COMPLETE",
+                        "Pivoted DataFrame created",
+                    )
                 )
-            )
             self._log_and_display(
                 self.inspector.inspect_dataframe(
                     self.state.final_dataframe, "Final Aggregated DataFrame"
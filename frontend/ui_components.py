@@ -1,11 +1,20 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-from typing import Dict, List, Callable, Optional
+from typing import Dict, List, Callable, Optional, Set
 from datetime import datetime
 import polars as pl
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+# Number of checkbox columns per row in the stage 2 column selection tabs
+CHECKBOX_GRID_COLUMNS = 5
+
+# Maximum number of lines retained in the inspection log widget
+MAX_LOG_LINES = 5000
+
+# Delay before re-filtering checkboxes, so rapid keystrokes coalesce
+FILTER_DEBOUNCE_MS = 150
+
 
 class InspectionPanel(ttk.LabelFrame):
     """Bottom panel for displaying validation and inspection logs"""
@@ -31,10 +40,12 @@ class InspectionPanel(ttk.LabelFrame):
             side=tk.RIGHT, padx=5
         )
 
-    def update_log(self, content: str):
-        """Update log display with new content"""
-        self.log_text.delete(1.0, tk.END)
+    def append_log(self, content: str):
+        """Append new content to the log display, dropping the oldest lines"""
         self.log_text.insert(tk.END, content)
+        line_count = int(self.log_text.index("end-1c").split(".")[0])
+        if line_count > MAX_LOG_LINES:
+            self.log_text.delete(1.0, f"{line_count - MAX_LOG_LINES + 1}.0")
         self.log_text.see(tk.END)
 
     def _clear_log(self):
@@ -43,13 +54,19 @@ class InspectionPanel(ttk.LabelFrame):
 
     def _export_log(self):
         """Export current log to text file"""
-        filename = f"inspection_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        now = datetime.now()
+        filename = f"inspection_log_{now.strftime('%Y%m%d_%H%M%S')}.txt"
         try:
             content = self.log_text.get(1.0, tk.END)
-            with open(filename, "w") as f:
-                f.write(f"EXCEL DATA PIPELINE - INSPECTION LOG\n{'=' * 70}\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"{'=' * 70}\n\n{content}")
+            body = (
+                f"EXCEL DATA PIPELINE - INSPECTION LOG\n{'=' * 70}\n"
+                f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"{'=' * 70}\n\n{content}"
+            )
+            # Write the whole report in a single call; text mode keeps the
+            # platform's newline translation
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(body)
             messagebox.showinfo("Log Exported", f"Log exported to: {filename}")
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export log: {e}")
@@ -64,6 +81,16 @@ class ColumnSelectionTabs(ttk.Notebook):
         self.on_selection_change = on_selection_change
         self.checkboxes: Dict[str, Dict] = {}
         self.tab_widgets: Dict[str, Dict] = {}
+        self._tab_keys: List[str] = []
+        self._populated: Set[str] = set()
+        self._filter_after_id: Dict[str, str] = {}
+        self._selected_count = 0
+
+        # Grid positions are identical for every tab, so compute them once
+        self._layout = [
+            (column, *divmod(i, CHECKBOX_GRID_COLUMNS))
+            for i, column in enumerate(self.columns)
+        ]
 
         sections = [
             ("Location", "location", "Spatial identifiers (e.g., pit, strip, block)"),
@@ -75,9 +102,14 @@ class ColumnSelectionTabs(ttk.Notebook):
         for title, key, desc in sections:
             tab = self._create_tab(title, key, desc)
             self.add(tab, text=title)
+            self._tab_keys.append(key)
+
+        # Checkbox widgets are only built when a tab is first shown
+        self.bind("<<NotebookTabChanged>>", self._ensure_tab_populated)
+        self._populate_tab(self._tab_keys[0])
 
     def _create_tab(self, title: str, key: str, description: str) -> ttk.Frame:
-        """Create a single tab with searchable checkboxes"""
+        """Create a single tab with a search box and an empty checkbox area"""
         tab = ttk.Frame(self, padding="15")
         tab.columnconfigure(0, weight=1)
         tab.rowconfigure(2, weight=1)
@@ -92,7 +124,7 @@ class ColumnSelectionTabs(ttk.Notebook):
 
         search_entry = ttk.Entry(search_frame)
         search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        search_entry.bind("<KeyRelease>", lambda e, k=key: self._filter_columns(k))
+        search_entry.bind("<KeyRelease>", lambda e, k=key: self._schedule_filter(k))
 
         canvas = tk.Canvas(tab, highlightthickness=0)
         scrollbar = ttk.Scrollbar(tab, orient="vertical", command=canvas.yview)
@@ -116,43 +148,89 @@ class ColumnSelectionTabs(ttk.Notebook):
         self.tab_widgets[key] = {
             "search_entry": search_entry,
             "scrollable_frame": scrollable_frame,
+            "on_mousewheel": _on_mousewheel,
+        }
+
+        # Variables are created up front so selections can be read and set
+        # before a tab has been viewed; the widgets themselves are deferred
+        self.checkboxes[key] = {
+            column: {"var": tk.BooleanVar(), "widget": None, "lower": column.lower()}
+            for column in self.columns
         }
 
-        self.checkboxes[key] = {}
-        # Controls number of colomns in stage 2 screen
-        num_columns = 5
-        for i, column in enumerate(self.columns):
-            var = tk.BooleanVar()
+        return tab
+
+    def _ensure_tab_populated(self, event=None):
+        """Build checkbox widgets for the currently selected tab if needed"""
+        self._populate_tab(self._tab_keys[self.index("current")])
+
+    def _populate_tab(self, key: str):
+        """Create the checkbox widgets for a single tab"""
+        if key in self._populated:
+            return
+        self._populated.add(key)
+
+        scrollable_frame = self.tab_widgets[key]["scrollable_frame"]
+        on_mousewheel = self.tab_widgets[key]["on_mousewheel"]
+        for column, row, col in self._layout:
+            data = self.checkboxes[key][column]
             cb = ttk.Checkbutton(
                 scrollable_frame,
                 text=column,
-                variable=var,
-                command=self.on_selection_change,
+                variable=data["var"],
+                command=lambda v=data["var"]: self._on_toggle(v),
             )
-            row, col = divmod(i, num_columns)
             cb.grid(row=row, column=col, sticky="w", padx=10, pady=3)
-            cb.bind("<MouseWheel>", _on_mousewheel)
-            self.checkboxes[key][column] = {"var": var, "widget": cb}
+            cb.bind("<MouseWheel>", on_mousewheel)
+            data["widget"] = cb
+
+    def _schedule_filter(self, category_key: str):
+        """Debounce filtering so only the last keystroke in a burst re-lays out"""
+        pending = self._filter_after_id.pop(category_key, None)
+        if pending:
+            self.after_cancel(pending)
+        self._filter_after_id[category_key] = self.after(
+            FILTER_DEBOUNCE_MS, lambda: self._filter_columns(category_key)
+        )
 
-        return tab
+    def destroy(self):
+        """Cancel pending filter callbacks so none fire on a destroyed widget"""
+        for pending in self._filter_after_id.values():
+            self.after_cancel(pending)
+        self._filter_after_id.clear()
+        super().destroy()
 
     def _filter_columns(self, category_key: str):
         """Filter checkboxes based on search term"""
+        self._filter_after_id.pop(category_key, None)
+        if category_key not in self._populated:
+            return
+
         search_term = self.tab_widgets[category_key]["search_entry"].get().lower()
 
         visible_columns = [
-            col for col in self.checkboxes[category_key] if search_term in col.lower()
+            col
+            for col, data in self.checkboxes[category_key].items()
+            if search_term in data["lower"]
         ]
 
-        for data in self.checkboxes[category_key].values():
-            data["widget"].grid_remove()
+        # Hide every checkbox with a single Tcl call rather than one per widget
+        widgets = [
+            str(data["widget"]) for data in self.checkboxes[category_key].values()
+        ]
+        if widgets:
+            self.tk.call("grid", "remove", *widgets)
 
-        num_columns = 4
         for i, column in enumerate(visible_columns):
             widget = self.checkboxes[category_key][column]["widget"]
-            row, col = divmod(i, num_columns)
+            row, col = divmod(i, CHECKBOX_GRID_COLUMNS)
             widget.grid(row=row, column=col, sticky="w", padx=10, pady=3)
 
+    def _on_toggle(self, var: tk.BooleanVar):
+        """Keep the selection count up to date as a single checkbox changes"""
+        self._selected_count += 1 if var.get() else -1
+        self.on_selection_change()
+
     def get_selected_columns(self) -> Dict[str, List[str]]:
         """Return dictionary of selected columns by category"""
         selected = {key: [] for key in self.checkboxes.keys()}
@@ -164,11 +242,7 @@ class ColumnSelectionTabs(ttk.Notebook):
 
     def get_selection_count(self) -> int:
         """Return total number of selected columns"""
-        return sum(
-            data["var"].get()
-            for cat in self.checkboxes.values()
-            for data in cat.values()
-        )
+        return self._selected_count
 
     def set_selections(self, selections: Dict[str, List[str]]):
         """Set checkboxes based on a dictionary of pre-selected columns."""
@@ -177,7 +251,10 @@ class ColumnSelectionTabs(ttk.Notebook):
             if category in self.checkboxes:
                 for column in columns:
                     if column in self.checkboxes[category]:
-                        self.checkboxes[category][column]["var"].set(True)
+                        var = self.checkboxes[category][column]["var"]
+                        if not var.get():
+                            var.set(True)
+                            self._selected_count += 1
         self.on_selection_change()
 
     def clear_all(self):
@@ -185,6 +262,7 @@ class ColumnSelectionTabs(ttk.Notebook):
         for section in self.checkboxes.values():
             for data in section.values():
                 data["var"].set(False)
+        self._selected_count = 0
 
 
 class PlotView(ttk.Frame):
@@ -208,6 +286,8 @@ class PlotView(ttk.Frame):
         self.rowconfigure(1, weight=1)
 
         self.entry_labels = self._generate_entry_labels()
+        # The month columns are fixed for this frame, so derive them once
+        self.month_cols = plot_generator.get_month_columns(dataframe, grouping_cols)
         self.plot_figure: Optional[plt.Figure] = None
         self.plot_canvas: Optional[FigureCanvasTkAgg] = None
 
@@ -385,14 +465,17 @@ class PlotView(ttk.Frame):
             selected_entry_label=selected_label,
             grouping_cols=self.grouping_cols,
             plot_settings=self.plot_settings,
+            month_cols=self.month_cols,
+            figure=self.plot_figure,
         )
 
-        if self.plot_canvas:
-            self.plot_canvas.get_tk_widget().destroy()
-
-        self.plot_canvas = FigureCanvasTkAgg(self.plot_figure, self.plot_container)
-        self.plot_canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
-        self.plot_canvas.draw()
+        # The figure and canvas are created once and redrawn in place afterwards
+        if self.plot_canvas is None:
+            self.plot_canvas = FigureCanvasTkAgg(self.plot_figure, self.plot_container)
+            self.plot_canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+            self.plot_canvas.draw()
+        else:
+            self.plot_canvas.draw_idle()
 
     def export_plot(self):
         """Export current plot as PNG file"""
@@ -411,7 +494,7 @@ class PlotView(ttk.Frame):
         )
 
         try:
-            self.plot_figure.savefig(filename, dpi=300, bbox_inches="tight")
+            self.plot_figure.savefig(filename, dpi=300)
             messagebox.showinfo("Plot Exported", f"Plot saved as: {filename}")
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export plot: {e}")